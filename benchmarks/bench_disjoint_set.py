@@ -0,0 +1,65 @@
+"""Benchmark DisjointSet against the union-find functions of graph.connectivity.
+
+Usage:
+    python benchmarks/bench_disjoint_set.py [--operations N] [--seed S]
+
+Runs N operations on N // 10 nodes: 80% unions over random pairs, then one find
+(or one component map) per node repeated to make up the remaining 20%.
+
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph.connectivity import DisjointSet, find, union
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DisjointSet against the union-find functions.")
+    parser.add_argument("--operations", type=int, default=10 ** 7, help="number of operations (default 10^7)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    number_nodes = max(args.operations // 10, 1)
+    number_unions = args.operations * 8 // 10
+    number_finds = args.operations - number_unions
+    rng = random.Random(args.seed)
+    sources = [rng.randrange(number_nodes) for _ in range(number_unions)]
+    targets = [rng.randrange(number_nodes) for _ in range(number_unions)]
+    queries = [rng.randrange(number_nodes) for _ in range(number_finds)]
+    print(str(args.operations) + " operations: " + str(number_unions) + " unions, " + str(number_finds)
+          + " finds on " + str(number_nodes) + " nodes")
+
+    start = time.perf_counter()
+    fathers = [-1] * number_nodes
+    for (node1, node2) in zip(sources, targets):
+        union(node1, node2, fathers)
+    middle = time.perf_counter()
+    roots = [find(node, fathers) for node in queries]
+    end = time.perf_counter()
+    print("functions:   unions " + format(middle - start, ".2f") + " s, finds " + format(end - middle, ".2f") + " s")
+
+    start = time.perf_counter()
+    disjoint_set = DisjointSet(number_nodes)
+    disjoint_set.union_many(sources, targets)
+    middle = time.perf_counter()
+    batched_roots = disjoint_set.find_many(queries)
+    end = time.perf_counter()
+    print("DisjointSet: unions " + format(middle - start, ".2f") + " s, finds " + format(end - middle, ".2f") + " s")
+
+    start = time.perf_counter()
+    (_, number_components) = disjoint_set.component_map()
+    print("component_map: " + format(time.perf_counter() - start, ".2f") + " s, "
+          + str(number_components) + " components")
+
+    # Both structures must agree on the partition
+    assert len(set(roots)) == len(set(batched_roots))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,40 @@ The node number can then be used to access its adjacency list.
 
 """
 
+_SUBMODULES = ("biconnectivity", "centrality", "colored", "connectivity", "csr", "flow", "generators",
+               "order", "reorder", "spanning", "strong_connectivity", "subgraph", "traversal", "types")
+
+
+def __getattr__(name):
+    """Import submodules on first access (graph.generators, ...)."""
+
+    if name in _SUBMODULES:
+        from importlib import import_module
+
+        return import_module("." + name, __name__)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
+
+
+class _LazyMethod:
+    """Graph method imported from a submodule on first access, then bound to the class directly."""
+
+    def __init__(self, module):
+        self.module = module
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        from importlib import import_module
+
+        function = getattr(import_module("." + self.module, __name__), self.name)
+        setattr(owner, self.name, function)
+        return function.__get__(instance, owner)
+
 
 class Graph:
     """ Simple class for graph: adjacency lists
@@ -23,14 +57,34 @@ class Graph:
         
     """
 
-    from .traversal import dfs, bfs
-    from .order import topological_order
-    from .colored import is_colored_nicely
-    from .types import is_eulerian
-    from .subgraph import build_subgraph
-    from .connectivity import to_matrix, to_tree
-    from .strong_connectivity import kosaraju, tarjan, reverse
-    
+    # Algorithms are loaded from their submodule on first use
+    dfs = _LazyMethod("traversal")
+    bfs = _LazyMethod("traversal")
+    shortest_paths = _LazyMethod("traversal")
+    topological_order = _LazyMethod("order")
+    is_colored_nicely = _LazyMethod("colored")
+    is_eulerian = _LazyMethod("types")
+    build_subgraph = _LazyMethod("subgraph")
+    to_matrix = _LazyMethod("connectivity")
+    to_tree = _LazyMethod("connectivity")
+    kosaraju = _LazyMethod("strong_connectivity")
+    tarjan = _LazyMethod("strong_connectivity")
+    reverse = _LazyMethod("strong_connectivity")
+    spanning_forest = _LazyMethod("spanning")
+    spanning_forest_graph = _LazyMethod("spanning")
+    articulation_points = _LazyMethod("biconnectivity")
+    bridges = _LazyMethod("biconnectivity")
+    biconnected_components = _LazyMethod("biconnectivity")
+    block_cut_tree = _LazyMethod("biconnectivity")
+    dinic = _LazyMethod("flow")
+    push_relabel = _LazyMethod("flow")
+    to_csr = _LazyMethod("csr")
+    reorder = _LazyMethod("reorder")
+    degree_centrality = _LazyMethod("centrality")
+    pagerank = _LazyMethod("centrality")
+    closeness_centrality = _LazyMethod("centrality")
+    betweenness_centrality = _LazyMethod("centrality")
+
 
     def __init__(self, order, directed=False, costs=False, labels=None):
         """Init graph, allocate adjacency lists
@@ -82,6 +136,42 @@ class Graph:
             if not self.directed:
                 self.costs[(dst, src)] = cost
 
+    def add_edges(self, sources, targets, costs=None):
+        """Add the edges (sources[i], targets[i]) to graph in bulk.
+
+        Args:
+            sources (sequence of int): Source nodes.
+            targets (sequence of int): Destination nodes.
+            costs (sequence): if not None, the cost of each edge
+
+        Raises:
+            IndexError: If any node index is invalid.
+
+        """
+
+        # Check node indices.
+        if len(sources) > 0:
+            if max(sources) >= self.order or min(sources) < 0:
+                raise IndexError("Invalid src index")
+            if max(targets) >= self.order or min(targets) < 0:
+                raise IndexError("Invalid dst index")
+
+        adjlists = self.adjlists
+        if self.directed:
+            for (src, dst) in zip(sources, targets):
+                adjlists[src].append(dst)
+        else:
+            for (src, dst) in zip(sources, targets):
+                adjlists[src].append(dst)
+                if dst != src:
+                    adjlists[dst].append(src)
+        if self.costs is not None:
+            if costs is None:
+                costs = [None] * len(sources)
+            self.costs.update(zip(zip(sources, targets), costs))
+            if not self.directed:
+                self.costs.update(zip(zip(targets, sources), costs))
+
 
     def add_node(self, number=1, labels=None):
         """Add number nodes to graph.
@@ -125,6 +215,81 @@ class Graph:
                 if self.costs:
                     self.costs.pop((dst, src))
 
+    def remove_edges(self, edges, log=False):
+        """Remove many edges from the graph in a single pass per affected node.
+
+        Each (src, dst) pair removes one occurrence of the edge, as remove_edge does.
+        Pairs of missing edges are ignored.
+
+        Args:
+            edges (iterable of (int, int)): Edges to remove. (src, dst, cost) triples
+                of a delta log are accepted, their cost being ignored.
+            log (bool): True to return the delta log of removed edges.
+
+        Returns:
+            list[tuple]: if log, the removed edges as (src, dst, cost) triples, else None.
+            The log can be replayed with remove_edges or reverted with restore_edges.
+
+        Raises:
+            IndexError: If any node index is invalid.
+
+        """
+
+        # Count requested removals per edge (undirected edges as (min, max))
+        requested = {}
+        for edge in edges:
+            (src, dst) = (edge[0], edge[1])
+            if src >= self.order or src < 0:
+                raise IndexError("Invalid src index")
+            if dst >= self.order or dst < 0:
+                raise IndexError("Invalid dst index")
+            if not self.directed and src > dst:
+                src, dst = dst, src
+            requested[(src, dst)] = requested.get((src, dst), 0) + 1
+
+        # Group pending removals by node
+        pending = {}
+        for ((src, dst), count) in requested.items():
+            pending.setdefault(src, {})[dst] = count
+            if not self.directed and src != dst:
+                pending.setdefault(dst, {})[src] = count
+
+        # Rebuild each affected adjacency list once
+        for (node, todo) in pending.items():
+            kept = []
+            for neigh in self.adjlists[node]:
+                if todo.get(neigh, 0) > 0:
+                    todo[neigh] -= 1
+                else:
+                    kept.append(neigh)
+            self.adjlists[node] = kept
+
+        # Sync costs and build the log from the removals actually done
+        delta = [] if log else None
+        for ((src, dst), count) in requested.items():
+            removed = count - pending[src][dst]
+            if removed == 0:
+                continue
+            cost = None
+            if self.costs is not None:
+                cost = self.costs.pop((src, dst), None)
+                if not self.directed:
+                    self.costs.pop((dst, src), None)
+            if log:
+                delta.extend([(src, dst, cost)] * removed)
+        return delta
+
+    def restore_edges(self, delta):
+        """Revert a delta log returned by remove_edges.
+
+        Args:
+            delta (list[tuple]): Removed edges as (src, dst, cost) triples.
+
+        """
+
+        for (src, dst, cost) in reversed(delta):
+            self.add_edge(src, dst, cost)
+
 def sort(G):
     """
     sorts adjacency lists
@@ -217,7 +382,7 @@ def load(filename):
 
     if infos and "labels" in infos:
         labels = infos["labels"].split(',') #labels is a list of str
-        G = Graph(order, directed, labels)  # a graph with labels
+        G = Graph(order, directed, labels=labels)  # a graph with labels
     else:
         G = Graph(order, directed)  # a graph without labels
     if infos:
@@ -278,3 +443,136 @@ def save(G, fileOut):
     fout = open(fileOut, mode='w')
     fout.write(gra)
     fout.close()
+
+
+def save_chunks(fileOut, order, chunks, directed=False):
+    """Write a GRA (or WGRA) file from edge chunks, one chunk at a time.
+
+    Args:
+        fileOut (str): File to write.
+        order (int): Number of nodes.
+        chunks (iterable): (sources, targets) or (sources, targets, costs) sequences,
+            each undirected edge appearing once.
+        directed (bool): True if the graph is directed. False otherwise.
+
+    """
+
+    fout = open(fileOut, mode='w')
+    fout.write(str(int(directed)) + '\n' + str(order) + '\n')
+    for chunk in chunks:
+        if len(chunk) == 3:
+            fout.writelines([str(x) + " " + str(y) + " " + str(cost) + '\n' for (x, y, cost) in zip(*chunk)])
+        else:
+            fout.writelines([str(x) + " " + str(y) + '\n' for (x, y) in zip(*chunk)])
+    fout.close()
+
+
+# load / save binary format
+#   header: b"GRAB", directed (uint8), weighted (uint8), order (int64)
+#   then blocks: count (int64), count sources (int64), count targets (int64)[, count costs (float64)]
+#   all little-endian, each undirected edge appearing once
+
+def save_binary_chunks(fileOut, order, chunks, directed=False, weighted=False):
+    """Write a binary graph file from edge chunks, one chunk at a time.
+
+    Args:
+        fileOut (str): File to write.
+        order (int): Number of nodes.
+        chunks (iterable): (sources, targets) or, if weighted, (sources, targets, costs) sequences.
+        directed (bool): True if the graph is directed. False otherwise.
+        weighted (bool): True if chunks have costs. False otherwise.
+
+    Raises:
+        ValueError: If a cost is None (the format stores float64 costs only).
+
+    """
+
+    import struct
+    import sys
+    from array import array
+
+    fout = open(fileOut, mode='wb')
+    fout.write(b"GRAB" + struct.pack("<BBq", int(directed), int(weighted), order))
+    for chunk in chunks:
+        columns = [array('q', chunk[0]), array('q', chunk[1])]
+        if weighted:
+            try:
+                columns.append(array('d', chunk[2]))
+            except TypeError:
+                fout.close()
+                raise ValueError("Binary graph files cannot store None costs") from None
+        fout.write(struct.pack("<q", len(columns[0])))
+        for column in columns:
+            if sys.byteorder == "big":
+                column.byteswap()
+            column.tofile(fout)
+    fout.close()
+
+
+def save_binary(G, fileOut):
+    """Write graph G to a binary graph file (labels are not kept).
+
+    Args:
+        G (Graph)
+        fileOut (str): File to write.
+
+    Raises:
+        ValueError: If G has edges without cost (None), nothing being written then.
+
+    """
+
+    weighted = G.costs is not None
+    if weighted and None in G.costs.values():
+        raise ValueError("Binary graph files cannot store None costs")
+    def chunks():
+        for x in range(G.order):
+            targets = [y for y in G.adjlists[x] if G.directed or x >= y]
+            if targets:
+                chunk = ([x] * len(targets), targets)
+                if weighted:
+                    chunk += ([G.costs[(x, y)] for y in targets],)
+                yield chunk
+    save_binary_chunks(fileOut, G.order, chunks(), G.directed, weighted)
+
+
+def load_binary(filename):
+    """Build a new graph from a binary graph file.
+
+    Args:
+        filename (str): File to load.
+
+    Returns:
+        Graph: New graph.
+
+    Raises:
+        FileNotFoundError: If file does not exist.
+        ValueError: If file is not a binary graph file.
+
+    """
+
+    import struct
+    import sys
+    from array import array
+
+    f = open(filename, mode='rb')
+    header = f.read(14)
+    if header[:4] != b"GRAB":
+        f.close()
+        raise ValueError("Not a binary graph file")
+    (directed, weighted, order) = struct.unpack("<BBq", header[4:])
+    G = Graph(order, bool(directed), costs=bool(weighted))
+
+    block = f.read(8)
+    while block:
+        (count,) = struct.unpack("<q", block)
+        columns = [array('q'), array('q')]
+        if weighted:
+            columns.append(array('d'))
+        for column in columns:
+            column.fromfile(f, count)
+            if sys.byteorder == "big":
+                column.byteswap()
+        G.add_edges(*columns)
+        block = f.read(8)
+    f.close()
+    return G
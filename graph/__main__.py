@@ -0,0 +1,169 @@
+"""Batch graph analytics on GRA, WGRA or binary graph files.
+
+Usage:
+    python -m graph FILE [QUERY ...] [--batch] [--no-memory]
+
+Queries (one per argument, or one per line of stdin with --batch):
+    stats               order, number of edges and degrees
+    components          connected components (undirected view of the graph)
+    scc                 strongly connected components (Tarjan)
+    topo                topological order
+    paths SRC           shortest path distances and fathers from SRC
+
+Each result is printed on stdout as a JSON line, the time and peak memory
+of each stage (loading, then each query) on stderr.
+
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import graph
+
+
+## ITER
+def load_graph(filename: str) -> graph.Graph:
+    """Load a graph, the format being chosen from the file extension (.wgra, .grb or GRA otherwise).
+    """
+
+    if filename.endswith(".wgra"):
+        return graph.load_weightedgraph(filename)
+    if filename.endswith(".grb"):
+        return graph.load_binary(filename)
+    return graph.load(filename)
+
+## ITER
+def stats(G: graph.Graph) -> dict:
+    """Get the order, number of edges, self-loops and degree statistics of graph G.
+    """
+
+    degrees = [len(neighbours) for neighbours in G.adjlists]
+    loops = sum(1 for node in range(G.order) if node in G.adjlists[node])
+    edges = sum(degrees) if G.directed else (sum(degrees) + loops) // 2
+    return {
+        "order": G.order,
+        "edges": edges,
+        "directed": G.directed,
+        "weighted": G.costs is not None,
+        "self_loops": loops,
+        "min_degree": min(degrees, default=0),
+        "max_degree": max(degrees, default=0),
+        "mean_degree": sum(degrees) / G.order if G.order else 0,
+    }
+
+## ITER
+def components(G: graph.Graph) -> dict:
+    """Get the connected component map (numbered from 1) and the number of components of graph G.
+    """
+
+    from graph.connectivity import DisjointSet
+
+    disjoint_set = DisjointSet(G.order)
+    for node in range(G.order):
+        disjoint_set.union_many([node] * len(G.adjlists[node]), G.adjlists[node])
+    (component_map, number_components) = disjoint_set.component_map()
+    return {"count": number_components, "map": component_map}
+
+## ITER
+def scc(G: graph.Graph) -> dict:
+    """Get the strongly connected component map and the number of components of graph G.
+    """
+
+    (component_map, number_components) = G.tarjan()
+    return {"count": number_components, "map": component_map}
+
+## ITER
+def topo(G: graph.Graph) -> list[int]:
+    """Get a topological order of graph G.
+    """
+
+    return G.topological_order()
+
+## ITER
+def paths(G: graph.Graph, src: str) -> dict:
+    """Get the shortest path distances and fathers from src in graph G.
+    """
+
+    (dist, fathers) = G.shortest_paths(int(src))
+    return {"src": int(src), "dist": dist, "fathers": fathers}
+
+
+# Query name -> (function, names of its parameters)
+QUERIES = {
+    "stats": (stats, ()),
+    "components": (components, ()),
+    "scc": (scc, ()),
+    "topo": (topo, ()),
+    "paths": (paths, ("SRC",)),
+}
+
+
+## ITER
+def run_stage(name: str, memory: bool, function, *args):
+    """Run function(*args) and report its time and peak memory on stderr.
+    """
+
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        return function(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        report = name + ": " + format(elapsed, ".3f") + " s"
+        if memory:
+            (_, peak) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report += ", peak " + format(peak / (1 << 20), ".1f") + " MiB"
+        print(report, file=sys.stderr)
+
+## ITER
+def main(argv: list[str] = None) -> int:
+    """Load the graph file once, then run every query on it. Return the exit status.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m graph", description="Batch graph analytics on GRA, WGRA or binary graph files.",
+                                     epilog="queries: " + ", ".join(QUERIES) + " (paths takes a source node)")
+    parser.add_argument("file", help="graph file (.gra, .wgra or .grb)")
+    parser.add_argument("queries", nargs="*", help="queries to run, e.g. stats or 'paths 0'")
+    parser.add_argument("--batch", action="store_true", help="also read queries from stdin, one per line")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="do not trace peak memory (faster)")
+    args = parser.parse_args(argv)
+
+    queries = list(args.queries)
+    if args.batch:
+        queries += [line.strip() for line in sys.stdin if line.strip() and not line.startswith('#')]
+
+    G = run_stage("load " + args.file, args.memory, load_graph, args.file)
+
+    status = 0
+    for query in queries:
+        if not query.split():
+            print("empty query", file=sys.stderr)
+            status = 1
+            continue
+        (name, *params) = query.split()
+        if name not in QUERIES:
+            print("unknown query: " + query, file=sys.stderr)
+            status = 1
+            continue
+        (function, names) = QUERIES[name]
+        if len(params) != len(names):
+            print("usage: " + " ".join((name,) + names), file=sys.stderr)
+            status = 1
+            continue
+        try:
+            result = run_stage(query, args.memory, function, G, *params)
+        except Exception as error:
+            print(query + ": " + type(error).__name__ + ": " + str(error), file=sys.stderr)
+            status = 1
+            continue
+        print(json.dumps({"query": query, "result": result}))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
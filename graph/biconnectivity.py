@@ -0,0 +1,131 @@
+from __future__ import annotations
+import graph
+
+## ITER
+def _biconnect(G: graph.Graph) -> tuple[list[bool], list[tuple[int, int]], list[list[int]]]:
+    """Run an iterative DFS computing low-links (as in Tarjan's algorithm) on undirected graph G.\\
+    Get the articulation point flags, the bridges and the biconnected components (lists of nodes).
+    """
+
+    if G.directed:
+        raise Exception("Graph is directed")
+
+    prefix_index = [0] * G.order
+    return_value = [0] * G.order
+    fathers = [-1] * G.order
+    next_index = [0] * G.order
+    # Skip the tree edge to the father only once (parallel edges are cycles)
+    father_skipped = [False] * G.order
+
+    is_articulation = [False] * G.order
+    bridges = []
+    components = []
+    edge_stack = []
+    counter = 0
+
+    for root in range(G.order):
+        if prefix_index[root] != 0:
+            continue
+
+        counter += 1
+        prefix_index[root] = return_value[root] = counter
+        root_children = 0
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if next_index[node] < len(G.adjlists[node]):
+                neigh = G.adjlists[node][next_index[node]]
+                next_index[node] += 1
+
+                if neigh == fathers[node] and not father_skipped[node]:
+                    father_skipped[node] = True
+                elif prefix_index[neigh] == 0:
+                    # Tree edge
+                    edge_stack.append((node, neigh))
+                    fathers[neigh] = node
+                    counter += 1
+                    prefix_index[neigh] = return_value[neigh] = counter
+                    if node == root:
+                        root_children += 1
+                    stack.append(neigh)
+                elif prefix_index[neigh] < prefix_index[node]:
+                    # Back edge to an ancestor (self-loops are ignored)
+                    edge_stack.append((node, neigh))
+                    return_value[node] = min(return_value[node], prefix_index[neigh])
+            else:
+                stack.pop()
+                father = fathers[node]
+                if father == -1:
+                    continue
+                return_value[father] = min(return_value[father], return_value[node])
+
+                # No back edge from the subtree of node above father
+                if return_value[node] >= prefix_index[father]:
+                    if father != root:
+                        is_articulation[father] = True
+
+                    # Pop the edges of the component up to the tree edge (father, node)
+                    component = set()
+                    edge = None
+                    while edge != (father, node):
+                        edge = edge_stack.pop()
+                        component.update(edge)
+                    components.append(list(component))
+
+                if return_value[node] > prefix_index[father]:
+                    bridges.append((father, node))
+
+        if root_children > 1:
+            is_articulation[root] = True
+
+    return (is_articulation, bridges, components)
+
+## ITER
+def articulation_points(self) -> list[int]:
+    """Get the articulation points (cut vertices) of undirected graph G.
+    """
+
+    (is_articulation, _, _) = _biconnect(self)
+    return [node for node in range(self.order) if is_articulation[node]]
+
+## ITER
+def bridges(self) -> list[tuple[int, int]]:
+    """Get the bridges (cut edges) of undirected graph G.
+    """
+
+    (_, bridges, _) = _biconnect(self)
+    return bridges
+
+## ITER
+def biconnected_components(self) -> list[list[int]]:
+    """Get the biconnected components (lists of nodes) of undirected graph G.\\
+    Isolated nodes do not belong to any component.
+    """
+
+    (_, _, components) = _biconnect(self)
+    return components
+
+## ITER
+def block_cut_tree(self) -> tuple[graph.Graph, list[list[int]]]:
+    """Get the block-cut tree of undirected graph G and the nodes of G for each tree node.\\
+    Tree nodes are the biconnected components first, then the articulation points,
+    each block being linked to the articulation points it contains.
+    """
+
+    (is_articulation, _, components) = _biconnect(self)
+
+    # Number the articulation points after the blocks
+    cut_index = [None] * self.order
+    tree_nodes = [list(component) for component in components]
+    for node in range(self.order):
+        if is_articulation[node]:
+            cut_index[node] = len(tree_nodes)
+            tree_nodes.append([node])
+
+    tree = graph.Graph(len(tree_nodes), False)
+    for (block, component) in enumerate(components):
+        for node in component:
+            if cut_index[node] is not None:
+                tree.add_edge(block, cut_index[node])
+
+    return (tree, tree_nodes)
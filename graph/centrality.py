@@ -0,0 +1,143 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+import random
+import graph
+from .csr import to_csr, reverse_csr
+
+## ITER
+def degree_centrality(self) -> list[float]:
+    """Get the degree centrality of each node of graph G (out-degree divided by order minus one).
+    """
+
+    if self.order <= 1:
+        return [0.0] * self.order
+    scale = 1 / (self.order - 1)
+    return [len(neighbours) * scale for neighbours in self.adjlists]
+
+## ITER
+def pagerank(self, damping: float = 0.85, tolerance: float = 1e-6, max_iterations: int = 100) -> list[float]:
+    """Get the PageRank of each node of graph G by power iteration on its compressed sparse row view.\\
+    The rank of dangling nodes (without neighbours) is spread uniformly over all nodes.
+    Iterate until the L1 change of the ranks is below tolerance or max_iterations is reached.
+    """
+
+    order = self.order
+    if order == 0:
+        return []
+
+    (offsets, targets) = to_csr(self)
+    (reverse_offsets, reverse_targets) = reverse_csr(offsets, targets)
+    inverse_degrees = [1 / (offsets[node + 1] - offsets[node]) if offsets[node + 1] > offsets[node] else 0.0
+                       for node in range(order)]
+    dangling = [node for node in range(order) if offsets[node + 1] == offsets[node]]
+    sources = [reverse_targets[reverse_offsets[node]:reverse_offsets[node + 1]] for node in range(order)]
+
+    rank = [1 / order] * order
+    for _ in range(max_iterations):
+        # Pull the contribution of the in-neighbours of each node
+        contributions = [r * inverse for (r, inverse) in zip(rank, inverse_degrees)]
+        base = (1 - damping + damping * sum(rank[node] for node in dangling)) / order
+        new_rank = [base + damping * sum(map(contributions.__getitem__, incoming)) for incoming in sources]
+
+        change = sum(abs(new - old) for (new, old) in zip(new_rank, rank))
+        rank = new_rank
+        if change < tolerance:
+            break
+    return rank
+
+## ITER
+def closeness_centrality(self) -> list[float]:
+    """Get the closeness centrality of each node of graph G (number of reached nodes over the sum of
+    their distances, scaled by the fraction of reached nodes), using a breadth first search from each node.
+    """
+
+    (offsets, targets) = to_csr(self)
+    closeness = [0.0] * self.order
+    for src in range(self.order):
+        dist = array('q', [-1]) * self.order
+        dist[src] = 0
+        queue = deque([src])
+        total = 0
+        while queue:
+            node = queue.popleft()
+            total += dist[node]
+            for neigh in targets[offsets[node]:offsets[node + 1]]:
+                if dist[neigh] == -1:
+                    dist[neigh] = dist[node] + 1
+                    queue.append(neigh)
+
+        reached = len(dist) - dist.count(-1) - 1
+        if total > 0:
+            closeness[src] = (reached / total) * (reached / (self.order - 1))
+    return closeness
+
+## ITER
+def _brandes(offsets: array, targets: array, sources: list[int]) -> list[float]:
+    """Accumulate the dependencies of Brandes' algorithm from each source (unweighted shortest paths).
+    """
+
+    order = len(offsets) - 1
+    betweenness = [0.0] * order
+    for src in sources:
+        dist = [-1] * order
+        paths = [0] * order
+        dependency = [0.0] * order
+        predecessors = [[] for _ in range(order)]
+        visited = []
+
+        dist[src] = 0
+        paths[src] = 1
+        queue = deque([src])
+        while queue:
+            node = queue.popleft()
+            visited.append(node)
+            for neigh in targets[offsets[node]:offsets[node + 1]]:
+                if dist[neigh] == -1:
+                    dist[neigh] = dist[node] + 1
+                    queue.append(neigh)
+                if dist[neigh] == dist[node] + 1:
+                    paths[neigh] += paths[node]
+                    predecessors[neigh].append(node)
+
+        # Back-propagate dependencies in non-increasing distance order
+        for node in reversed(visited):
+            for father in predecessors[node]:
+                dependency[father] += paths[father] / paths[node] * (1 + dependency[node])
+            if node != src:
+                betweenness[node] += dependency[node]
+    return betweenness
+
+## ITER
+def betweenness_centrality(self, samples: int = None, seed: int = None, processes: int = None) -> list[float]:
+    """Get the betweenness centrality of each node of graph G using Brandes' algorithm.\\
+    If samples is given, only that many random source nodes are used and the result is extrapolated.
+    If processes is given, sources are split among that many worker processes.
+    """
+
+    if samples is not None and samples < 1:
+        raise ValueError("samples must be at least 1")
+
+    (offsets, targets) = to_csr(self)
+    sources = list(range(self.order))
+    scale = 1.0
+    if samples is not None and samples < self.order:
+        sources = random.Random(seed).sample(sources, samples)
+        scale = self.order / samples
+    # Undirected shortest paths are counted from both ends
+    if not self.directed:
+        scale /= 2
+
+    if processes is None or processes <= 1:
+        betweenness = _brandes(offsets, targets, sources)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [sources[i::processes] for i in range(processes)]
+        betweenness = [0.0] * self.order
+        with ProcessPoolExecutor(processes) as executor:
+            for partial in executor.map(_brandes, [offsets] * processes, [targets] * processes, chunks):
+                for node in range(self.order):
+                    betweenness[node] += partial[node]
+
+    return [value * scale for value in betweenness]
@@ -1,3 +1,5 @@
+from __future__ import annotations
+from array import array
 import graph
 
 ### Union-Find algorithm
@@ -25,8 +27,8 @@ def find(node: int, fathers: list[int]) -> int:
         root = fathers[root]
 
     # For all ancestors update their father to be the root
-    while fathers[node] != root:
-        node, fathers[node] = fathers[node], root
+    while node != root:
+        fathers[node], node = root, fathers[node]
 
     return root
 
@@ -76,6 +78,170 @@ def union_find(number_nodes: int, node_pairs: list[tuple[int, int]]) -> list[int
         union(node1, node2, fathers)
     return fathers
 
+class DisjointSet:
+    """ Union-Find structure over nodes 0 to number_nodes minus one, backed by a typed array
+
+    Attributes:
+        fathers (array): Father of each node, (- size of its set) for roots.
+        number_sets (int): Number of disjoint sets.
+
+    """
+
+    def __init__(self, number_nodes):
+        """Init disjoint set, each node being alone in its set
+
+        Args:
+            number_nodes (int): Number of nodes.
+
+        """
+
+        self.fathers = array('q', [-1]) * number_nodes
+        self.number_sets = number_nodes
+
+    def find(self, node):
+        """Find the root of the set of node, halving the path to it.
+
+        Args:
+            node (int): Node.
+
+        Returns:
+            int: Root node.
+
+        """
+
+        fathers = self.fathers
+        while fathers[node] >= 0:
+            father = fathers[node]
+            if fathers[father] < 0:
+                return father
+            # Link node to its grandfather and jump to it
+            fathers[node] = node = fathers[father]
+        return node
+
+    def union(self, node1, node2):
+        """Merge the sets of node1 and node2, the smallest set joining the largest one.
+
+        Args:
+            node1 (int): First node.
+            node2 (int): Second node.
+
+        Returns:
+            bool: True if the sets were different. False otherwise.
+
+        """
+
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 == root2:
+            return False
+
+        fathers = self.fathers
+        if fathers[root1] > fathers[root2]:
+            root1, root2 = root2, root1
+        fathers[root1] += fathers[root2]
+        fathers[root2] = root1
+        self.number_sets -= 1
+        return True
+
+    def union_many(self, sources, targets):
+        """Merge the sets of each pair of nodes (sources[i], targets[i]).
+
+        Args:
+            sources (sequence of int): First nodes of the pairs (e.g. edge sources).
+            targets (sequence of int): Second nodes of the pairs (e.g. edge destinations).
+
+        Returns:
+            int: Number of merges done.
+
+        """
+
+        fathers = self.fathers
+        merges = 0
+        for (root1, root2) in zip(sources, targets):
+            # Inline find with path halving
+            while fathers[root1] >= 0:
+                father = fathers[root1]
+                if fathers[father] < 0:
+                    root1 = father
+                    break
+                fathers[root1] = root1 = fathers[father]
+            while fathers[root2] >= 0:
+                father = fathers[root2]
+                if fathers[father] < 0:
+                    root2 = father
+                    break
+                fathers[root2] = root2 = fathers[father]
+
+            if root1 != root2:
+                if fathers[root1] > fathers[root2]:
+                    root1, root2 = root2, root1
+                fathers[root1] += fathers[root2]
+                fathers[root2] = root1
+                merges += 1
+
+        self.number_sets -= merges
+        return merges
+
+    def find_many(self, nodes):
+        """Find the root of the set of each node.
+
+        Args:
+            nodes (iterable of int): Nodes.
+
+        Returns:
+            list[int]: Root of each node.
+
+        """
+
+        find = self.find
+        return [find(node) for node in nodes]
+
+    def size(self, node):
+        """Size of the set of node.
+
+        Args:
+            node (int): Node.
+
+        Returns:
+            int: Number of nodes in the set.
+
+        """
+
+        return -self.fathers[self.find(node)]
+
+    def sizes(self):
+        """Sizes of all sets, indexed by root.
+
+        Returns:
+            dict: root (int) -> number of nodes in its set (int).
+
+        """
+
+        return {root: -father for (root, father) in enumerate(self.fathers) if father < 0}
+
+    def component_map(self):
+        """Number the sets from 1 in order of their smallest node, in a single pass over nodes.\\
+        Every node is linked directly to its root afterwards.
+
+        Returns:
+            tuple[list[int], int]: Set number of each node and number of sets.
+
+        """
+
+        fathers = self.fathers
+        component_map = [0] * len(fathers)
+        number_components = 0
+        for node in range(len(fathers)):
+            root = self.find(node)
+            if component_map[root] == 0:
+                # New set
+                number_components += 1
+                component_map[root] = number_components
+            component_map[node] = component_map[root]
+            if root != node:
+                fathers[node] = root
+        return (component_map, number_components)
+
 ## ITER
 def connected_componnent_map_from_edges_simple(number_nodes: int, node_pairs: list[tuple[int, int]]) -> tuple[list[int], int]:
     """Get the connected component for each node and the total number of connected componnents
@@ -104,21 +270,9 @@ def connected_componnent_map_from_edges_better(number_nodes: int, node_pairs: li
     from the list of edges and the number of nodes in a graph.
     """
 
-    fathers = union_find(number_nodes, node_pairs)
-    connected_componnent_map = [None] * number_nodes
-    number_connected_components = 0
-
-    for node in range(number_nodes):
-        #  Find root
-        root = find(node, fathers)
-
-        if connected_componnent_map[root] is None:
-            # New connected component
-            number_connected_components += 1
-            connected_componnent_map[root] = number_connected_components
-
-        connected_componnent_map[node] = connected_componnent_map[root]
-    return (connected_componnent_map, number_connected_components)
+    disjoint_set = DisjointSet(number_nodes)
+    disjoint_set.union_many([node1 for (node1, _) in node_pairs], [node2 for (_, node2) in node_pairs])
+    return disjoint_set.component_map()
 
 ## REC
 def connected_componnent_map_from_edges(number_nodes: int, node_pairs: list[tuple[int, int]]) -> tuple[list[int], int]:
@@ -298,10 +452,9 @@ def to_tree(self) -> list[int]:
             __make(self, node, connected_component_map, number_connected_components, -1, cycling_edges)
             
             # Link local root to tree root
-            self.addedge(0, node)
+            self.add_edge(0, node)
     
     # Remove all cycles
-    for (node1, node2) in cycling_edges:
-        self.removeedge(node1, node2)
+    self.remove_edges(cycling_edges)
     
     return connected_component_map
\ No newline at end of file
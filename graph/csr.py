@@ -0,0 +1,39 @@
+from __future__ import annotations
+from array import array
+import graph
+
+## ITER
+def to_csr(self) -> tuple[array, array]:
+    """Get the compressed sparse row view of graph G.\\
+    The neighbours of node x are targets[offsets[x]:offsets[x + 1]], in adjacency list order.
+    """
+
+    offsets = array('q', [0]) * (self.order + 1)
+    targets = array('q')
+    for node in range(self.order):
+        targets.extend(self.adjlists[node])
+        offsets[node + 1] = len(targets)
+    return (offsets, targets)
+
+## ITER
+def reverse_csr(offsets: array, targets: array) -> tuple[array, array]:
+    """Get the compressed sparse row view of the reversed graph from a compressed sparse row view.
+    """
+
+    order = len(offsets) - 1
+
+    # Count incoming edges
+    reverse_offsets = array('q', [0]) * (order + 1)
+    for neigh in targets:
+        reverse_offsets[neigh + 1] += 1
+    for node in range(order):
+        reverse_offsets[node + 1] += reverse_offsets[node]
+
+    # Place sources
+    reverse_targets = array('q', [0]) * len(targets)
+    position = array('q', reverse_offsets)
+    for node in range(order):
+        for neigh in targets[offsets[node]:offsets[node + 1]]:
+            reverse_targets[position[neigh]] = node
+            position[neigh] += 1
+    return (reverse_offsets, reverse_targets)
@@ -0,0 +1,263 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+import graph
+
+### Residual graph
+
+## ITER
+def _residual(G: graph.Graph) -> tuple[array, array, array, list, list[tuple[int, int, int]]]:
+    """Build the array-backed residual graph of graph G, edge costs being capacities (1 if G has no costs).\\
+    Arcs leaving node x are start[x] to start[x + 1] - 1, arc a goes to head[a] with residual capacity
+    capacity[a] and its reverse arc is reverse[a]. Also get the (src, dst, arc) list of the edges of G.
+    """
+
+    # Each edge of G, once (undirected edges have capacity both ways)
+    edges = []
+    for src in range(G.order):
+        for dst in G.adjlists[src]:
+            if src != dst and (G.directed or src < dst):
+                edges.append((src, dst))
+
+    # Count arcs per node
+    start = array('q', [0]) * (G.order + 1)
+    for (src, dst) in edges:
+        start[src + 1] += 1
+        start[dst + 1] += 1
+    for node in range(G.order):
+        start[node + 1] += start[node]
+
+    head = array('q', [0]) * (2 * len(edges))
+    reverse = array('q', [0]) * (2 * len(edges))
+    capacity = [0] * (2 * len(edges))
+    position = array('q', start)
+    edge_arcs = []
+    for (src, dst) in edges:
+        cap = G.costs[(src, dst)] if G.costs is not None else 1
+        arc = position[src]
+        back = position[dst]
+        position[src] += 1
+        position[dst] += 1
+        head[arc] = dst
+        head[back] = src
+        reverse[arc] = back
+        reverse[back] = arc
+        capacity[arc] = cap
+        capacity[back] = 0 if G.directed else cap
+        edge_arcs.append((src, dst, arc))
+
+    return (start, head, reverse, capacity, edge_arcs)
+
+## ITER
+def _flow_result(G: graph.Graph, src: int, flow_value, residual: tuple) -> tuple:
+    """Get the flow value, the flow on each edge of G and the edges of the minimum cut from the final residual graph.
+    """
+
+    (start, head, reverse, capacity, edge_arcs) = residual
+
+    # Source side of the cut: nodes reachable from src in the residual graph
+    reached = [False] * G.order
+    reached[src] = True
+    queue = deque([src])
+    while queue:
+        node = queue.popleft()
+        for arc in range(start[node], start[node + 1]):
+            if capacity[arc] > 0 and not reached[head[arc]]:
+                reached[head[arc]] = True
+                queue.append(head[arc])
+
+    flow = {}
+    cut = []
+    for (x, y, arc) in edge_arcs:
+        cap = G.costs[(x, y)] if G.costs is not None else 1
+        value = cap - capacity[arc]
+        flow[(x, y)] = flow.get((x, y), 0) + value
+        if not G.directed:
+            flow[(y, x)] = flow.get((y, x), 0) - value
+        if reached[x] and not reached[y]:
+            cut.append((x, y))
+        elif reached[y] and not reached[x] and not G.directed:
+            cut.append((y, x))
+
+    return (flow_value, flow, cut)
+
+### Dinic algorithm
+
+## ITER
+def dinic(self, src: int, dst: int) -> tuple:
+    """Get the maximum flow value from src to dst, the flow on each edge and the edges of the minimum cut
+    of graph G using Dinic's algorithm, edge costs being capacities.\\
+    For undirected graphs, flow[(x, y)] == -flow[(y, x)].
+    """
+
+    residual = _residual(self)
+    (start, head, reverse, capacity, _) = residual
+    flow_value = 0
+
+    while src != dst:
+        # Level graph
+        level = [-1] * self.order
+        level[src] = 0
+        queue = deque([src])
+        while queue:
+            node = queue.popleft()
+            for arc in range(start[node], start[node + 1]):
+                if capacity[arc] > 0 and level[head[arc]] == -1:
+                    level[head[arc]] = level[node] + 1
+                    queue.append(head[arc])
+        if level[dst] == -1:
+            break
+
+        # Blocking flow: advance along admissible arcs, retreat from dead ends
+        current = array('q', start)
+        path = []
+        node = src
+        while True:
+            if node == dst:
+                pushed = min(capacity[arc] for arc in path)
+                for arc in path:
+                    capacity[arc] -= pushed
+                    capacity[reverse[arc]] += pushed
+                flow_value += pushed
+
+                # Retreat before the first saturated arc
+                saturated = 0
+                while capacity[path[saturated]] > 0:
+                    saturated += 1
+                del path[saturated:]
+                node = head[path[-1]] if path else src
+                continue
+
+            arc = current[node]
+            end = start[node + 1]
+            while arc < end and (capacity[arc] <= 0 or level[head[arc]] != level[node] + 1):
+                arc += 1
+            current[node] = arc
+
+            if arc < end:
+                path.append(arc)
+                node = head[arc]
+            elif node == src:
+                break
+            else:
+                # Dead end
+                level[node] = -1
+                path.pop()
+                node = head[path[-1]] if path else src
+                current[node] += 1
+
+    return _flow_result(self, src, flow_value, residual)
+
+### Push-relabel algorithm
+
+## ITER
+def _global_relabel(G: graph.Graph, src: int, dst: int, residual: tuple, height: list[int], buckets: list[set]) -> int:
+    """Set heights to the exact residual distances to dst, or order plus the distance to src for nodes
+    that cannot reach dst (2 * order if neither), and refill the buckets of nodes at each height.
+    Return the highest height below order.
+    """
+
+    (start, head, reverse, capacity, _) = residual
+    unreached = 2 * G.order
+    for node in range(G.order):
+        height[node] = unreached
+
+    # Reverse breadth first searches from dst, then from src
+    for (root, base) in ((dst, 0), (src, G.order)):
+        height[root] = base
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for arc in range(start[node], start[node + 1]):
+                neigh = head[arc]
+                if height[neigh] == unreached and capacity[reverse[arc]] > 0:
+                    height[neigh] = height[node] + 1
+                    queue.append(neigh)
+
+    for bucket in buckets:
+        bucket.clear()
+    highest = 0
+    for node in range(G.order):
+        buckets[height[node]].add(node)
+        if height[node] < G.order:
+            highest = max(highest, height[node])
+    return highest
+
+## ITER
+def push_relabel(self, src: int, dst: int) -> tuple:
+    """Get the maximum flow value from src to dst, the flow on each edge and the edges of the minimum cut
+    of graph G using the FIFO push-relabel algorithm with gap and global relabelling, edge costs being capacities.\\
+    For undirected graphs, flow[(x, y)] == -flow[(y, x)].
+    """
+
+    residual = _residual(self)
+    (start, head, reverse, capacity, _) = residual
+    if src == dst:
+        return _flow_result(self, src, 0, residual)
+
+    order = self.order
+    height = [0] * order
+    # Nodes at each height
+    buckets = [set() for _ in range(2 * order + 1)]
+    queue = deque()
+
+    # Saturate arcs leaving src
+    excess = [0] * order
+    for arc in range(start[src], start[src + 1]):
+        pushed = capacity[arc]
+        if pushed > 0:
+            neigh = head[arc]
+            capacity[arc] = 0
+            capacity[reverse[arc]] += pushed
+            if excess[neigh] == 0 and neigh != dst:
+                queue.append(neigh)
+            excess[neigh] += pushed
+
+    highest = _global_relabel(self, src, dst, residual, height, buckets)
+
+    # Discharge active nodes in FIFO order
+    current = array('q', start)
+    relabels = 0
+    while queue:
+        node = queue.popleft()
+        while excess[node] > 0 and height[node] < 2 * order:
+            arc = current[node]
+            if arc == start[node + 1]:
+                # Relabel
+                old = height[node]
+                new = 1 + min(height[head[a]] for a in range(start[node], start[node + 1]) if capacity[a] > 0)
+                buckets[old].discard(node)
+                if old < order and not buckets[old]:
+                    # Gap: nodes above old can no longer reach dst
+                    for h in range(old + 1, highest + 1):
+                        for other in buckets[h]:
+                            height[other] = order + 1
+                        buckets[order + 1].update(buckets[h])
+                        buckets[h].clear()
+                    highest = old - 1
+                    new = max(new, order + 1)
+                height[node] = min(new, 2 * order)
+                buckets[height[node]].add(node)
+                if height[node] < order:
+                    highest = max(highest, height[node])
+                current[node] = start[node]
+
+                relabels += 1
+                if relabels % order == 0:
+                    highest = _global_relabel(self, src, dst, residual, height, buckets)
+                    current = array('q', start)
+                continue
+
+            neigh = head[arc]
+            if capacity[arc] > 0 and height[node] == height[neigh] + 1:
+                pushed = min(excess[node], capacity[arc])
+                capacity[arc] -= pushed
+                capacity[reverse[arc]] += pushed
+                excess[node] -= pushed
+                if excess[neigh] == 0 and neigh != src and neigh != dst:
+                    queue.append(neigh)
+                excess[neigh] += pushed
+            else:
+                current[node] += 1
+
+    return _flow_result(self, src, excess[dst], residual)
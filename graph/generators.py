@@ -0,0 +1,217 @@
+from __future__ import annotations
+from array import array
+import random
+import graph
+
+# Generators yield edges in chunks: (sources, targets) arrays, or (sources, targets, costs) once weighted,
+# each undirected edge appearing once. Chunks can be streamed to a file with graph.save_chunks or
+# graph.save_binary_chunks.
+CHUNK_SIZE = 1 << 16
+
+### Random graphs
+
+## ITER
+def erdos_renyi(order: int, size: int, seed: int = None, directed: bool = False, multigraph: bool = False):
+    """Generate the size edges of a uniform random graph G(order, size) without self-loops.\\
+    Edges are distinct unless multigraph is True, in which case they are drawn independently
+    and memory does not grow with size.
+    """
+
+    possible = order * (order - 1) if directed else order * (order - 1) // 2
+    if size > possible and not multigraph:
+        raise ValueError("Too many edges for the number of nodes")
+    if size > 0 and order < 2:
+        raise ValueError("Not enough nodes for edges without self-loops")
+
+    rand = random.Random(seed).random
+    seen = set()
+    generated = 0
+    while generated < size:
+        sources = array('q')
+        targets = array('q')
+        while len(sources) < CHUNK_SIZE and generated < size:
+            src = int(rand() * order)
+            dst = int(rand() * order)
+            if src == dst:
+                continue
+            if not directed and src > dst:
+                src, dst = dst, src
+            if not multigraph:
+                code = src * order + dst
+                if code in seen:
+                    continue
+                seen.add(code)
+            sources.append(src)
+            targets.append(dst)
+            generated += 1
+        yield (sources, targets)
+
+## ITER
+def random_dag(order: int, size: int, seed: int = None):
+    """Generate the size distinct edges of a random directed acyclic graph.\\
+    Edges follow a random topological order of the nodes.
+    """
+
+    rng = random.Random(seed)
+    ranks = list(range(order))
+    rng.shuffle(ranks)
+    for (sources, targets) in erdos_renyi(order, size, rng.random(), directed=False):
+        # Undirected edges go from the lowest to the highest rank
+        yield (array('q', [ranks[src] for src in sources]), array('q', [ranks[dst] for dst in targets]))
+
+## ITER
+def barabasi_albert(order: int, degree: int, seed: int = None):
+    """Generate the edges of an undirected Barabási–Albert preferential attachment graph.\\
+    Each node after the first degree ones is linked to degree distinct nodes chosen with probability
+    proportional to their degree. Memory grows with the number of edges.
+    """
+
+    if degree < 1 or degree >= order:
+        raise ValueError("Degree must be between 1 and order minus one")
+
+    rand = random.Random(seed).random
+    # Each node appears once per incident edge
+    endpoints = array('q')
+    sources = array('q')
+    targets = array('q')
+    for node in range(degree, order):
+        if node == degree:
+            chosen = list(range(degree))
+        else:
+            chosen = set()
+            while len(chosen) < degree:
+                chosen.add(endpoints[int(rand() * len(endpoints))])
+        for neigh in chosen:
+            sources.append(node)
+            targets.append(neigh)
+        endpoints.extend(chosen)
+        endpoints.extend([node] * degree)
+
+        if len(sources) >= CHUNK_SIZE:
+            yield (sources, targets)
+            sources = array('q')
+            targets = array('q')
+    if sources:
+        yield (sources, targets)
+
+## ITER
+def rmat(scale: int, size: int, a: float = 0.57, b: float = 0.19, c: float = 0.19, seed: int = None):
+    """Generate the size directed edges of an R-MAT (recursive Kronecker) graph of 2**scale nodes.\\
+    Each edge falls in the top-left, top-right, bottom-left or bottom-right quadrant of the
+    adjacency matrix with probability a, b, c or 1 - a - b - c, recursively. Duplicates may occur.
+    """
+
+    rand = random.Random(seed).random
+    ab = a + b
+    abc = a + b + c
+    generated = 0
+    while generated < size:
+        count = min(CHUNK_SIZE, size - generated)
+        sources = array('q', [0]) * count
+        targets = array('q', [0]) * count
+        for i in range(count):
+            src = dst = 0
+            for _ in range(scale):
+                r = rand()
+                src <<= 1
+                dst <<= 1
+                if r >= ab:
+                    src |= 1
+                    if r >= abc:
+                        dst |= 1
+                elif r >= a:
+                    dst |= 1
+            sources[i] = src
+            targets[i] = dst
+        generated += count
+        yield (sources, targets)
+
+### Regular graphs
+
+## ITER
+def grid(rows: int, columns: int):
+    """Generate the edges of an undirected rows x columns grid, node (r, c) being r * columns + c.
+    """
+
+    sources = array('q')
+    targets = array('q')
+    for row in range(rows):
+        for column in range(columns):
+            node = row * columns + column
+            if column + 1 < columns:
+                sources.append(node)
+                targets.append(node + 1)
+            if row + 1 < rows:
+                sources.append(node)
+                targets.append(node + columns)
+        if len(sources) >= CHUNK_SIZE:
+            yield (sources, targets)
+            sources = array('q')
+            targets = array('q')
+    if sources:
+        yield (sources, targets)
+
+### Weights and construction
+
+## ITER
+def weighted(chunks, low: float = 0.0, high: float = 1.0, seed: int = None, integer: bool = False):
+    """Add uniform random costs in [low, high) to edge chunks (integers in [low, high] if integer is True).
+    """
+
+    rng = random.Random(seed)
+    if integer:
+        (low, high) = (int(low), int(high))
+    for (sources, targets) in chunks:
+        if integer:
+            costs = array('q', [rng.randint(low, high) for _ in range(len(sources))])
+        else:
+            rand = rng.random
+            costs = array('d', [low + (high - low) * rand() for _ in range(len(sources))])
+        yield (sources, targets, costs)
+
+## ITER
+def from_chunks(order: int, chunks, directed: bool = False) -> graph.Graph:
+    """Build a new graph from edge chunks, weighted if chunks have costs.
+    """
+
+    G = None
+    for chunk in chunks:
+        if G is None:
+            G = graph.Graph(order, directed, costs=len(chunk) == 3)
+        G.add_edges(*chunk)
+    if G is None:
+        G = graph.Graph(order, directed)
+    return G
+
+## ITER
+def csr_from_chunks(order: int, chunks, directed: bool = False) -> tuple[array, array]:
+    """Build the compressed sparse row view (offsets, targets) of a graph directly from edge chunks.
+    """
+
+    all_sources = array('q')
+    all_targets = array('q')
+    for chunk in chunks:
+        all_sources.extend(chunk[0])
+        all_targets.extend(chunk[1])
+    if not directed:
+        # Add reversed edges, except for self-loops
+        (forward_sources, forward_targets) = (all_sources, all_targets)
+        all_sources = array('q', forward_sources)
+        all_targets = array('q', forward_targets)
+        for (src, dst) in zip(forward_sources, forward_targets):
+            if src != dst:
+                all_sources.append(dst)
+                all_targets.append(src)
+
+    # Counting sort by source
+    offsets = array('q', [0]) * (order + 1)
+    for src in all_sources:
+        offsets[src + 1] += 1
+    for node in range(order):
+        offsets[node + 1] += offsets[node]
+    targets = array('q', [0]) * len(all_targets)
+    position = array('q', offsets)
+    for (src, dst) in zip(all_sources, all_targets):
+        targets[position[src]] = dst
+        position[src] += 1
+    return (offsets, targets)
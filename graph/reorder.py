@@ -0,0 +1,65 @@
+from __future__ import annotations
+from collections import deque
+import graph
+
+## ITER
+def reorder(self, method: str = "rcm") -> tuple[graph.Graph, list[int], list[int]]:
+    """Build a compact copy of graph G with relabelled nodes, for a better memory locality of traversals.\\
+    Parallel edges are merged and adjacency lists are sorted. Costs and labels follow their nodes.
+    The method is either "bfs" (breadth first order), "rcm" (reverse Cuthill-McKee) or "degree"
+    (decreasing degree). Also get the permutation (old node -> new node) and its inverse (new node -> old node).
+    """
+
+    if method == "bfs":
+        inverse = _bfs_order(self, False)
+    elif method == "rcm":
+        inverse = _bfs_order(self, True)
+        inverse.reverse()
+    elif method == "degree":
+        inverse = sorted(range(self.order), key=lambda node: len(self.adjlists[node]), reverse=True)
+    else:
+        raise ValueError("Unknown reordering method: " + str(method))
+
+    permutation = [0] * self.order
+    for (new, old) in enumerate(inverse):
+        permutation[old] = new
+
+    labels = [self.labels[old] for old in inverse] if self.labels else self.labels
+    G = graph.Graph(self.order, self.directed, self.costs is not None, labels)
+    G.adjlists = [sorted({permutation[neigh] for neigh in self.adjlists[old]}) for old in inverse]
+    if self.costs is not None:
+        G.costs = {(permutation[src], permutation[dst]): cost for ((src, dst), cost) in self.costs.items()}
+
+    return (G, permutation, inverse)
+
+## ITER
+def _bfs_order(G: graph.Graph, by_degree: bool) -> list[int]:
+    """Get the nodes of graph G in breadth first order, each tree starting from its first node.\\
+    If by_degree, trees start from a node of minimum degree and neighbours are visited by increasing degree
+    (Cuthill-McKee order).
+    """
+
+    degree = [len(neighbours) for neighbours in G.adjlists]
+    roots = sorted(range(G.order), key=degree.__getitem__) if by_degree else range(G.order)
+
+    visited = [False] * G.order
+    order = []
+    queue = deque()
+    for root in roots:
+        if visited[root]:
+            continue
+
+        # New tree
+        visited[root] = True
+        queue.append(root)
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            neighbours = [neigh for neigh in G.adjlists[node] if not visited[neigh]]
+            if by_degree:
+                neighbours.sort(key=degree.__getitem__)
+            for neigh in neighbours:
+                if not visited[neigh]:
+                    visited[neigh] = True
+                    queue.append(neigh)
+    return order
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from collections import deque
+import graph
+from .connectivity import DisjointSet
+
+## ITER
+def spanning_forest(self, method: str = "bfs") -> list[int]:
+    """Get the list of fathers of a spanning forest of graph G without modifying it.\\
+    Roots have -1 as father. The method is either "bfs", "dfs" or "union_find" (undirected graphs only).
+    """
+
+    if method == "bfs":
+        return _bfs_forest(self)
+    if method == "dfs":
+        return _dfs_forest(self)
+    if method == "union_find":
+        if self.directed:
+            raise ValueError("union_find spanning forest needs an undirected graph")
+        return _union_find_forest(self)
+    raise ValueError("Unknown spanning forest method: " + str(method))
+
+## ITER
+def spanning_forest_graph(self, method: str = "bfs") -> graph.Graph:
+    """Build a new graph made of the edges (father, node) of a spanning forest of graph G.\\
+    Costs and labels are kept, graph G is not modified.
+    """
+
+    fathers = spanning_forest(self, method)
+    forest = graph.Graph(self.order, self.directed, self.costs is not None,
+                         list(self.labels) if self.labels else None)
+    for node in range(self.order):
+        father = fathers[node]
+        if father != -1:
+            cost = self.costs[(father, node)] if self.costs is not None else None
+            forest.add_edge(father, node, cost)
+    return forest
+
+## ITER
+def _bfs_forest(G: graph.Graph) -> list[int]:
+    fathers = [None] * G.order
+    queue = deque()
+
+    for root in range(G.order):
+        if fathers[root] is not None:
+            continue
+
+        # New tree
+        fathers[root] = -1
+        queue.append(root)
+        while queue:
+            node = queue.popleft()
+            for neigh in G.adjlists[node]:
+                if fathers[neigh] is None:
+                    fathers[neigh] = node
+                    queue.append(neigh)
+    return fathers
+
+## ITER
+def _dfs_forest(G: graph.Graph) -> list[int]:
+    fathers = [None] * G.order
+
+    # Next neighbour index to visit for each node on the stack
+    next_index = [0] * G.order
+
+    for root in range(G.order):
+        if fathers[root] is not None:
+            continue
+
+        # New tree
+        fathers[root] = -1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if next_index[node] < len(G.adjlists[node]):
+                neigh = G.adjlists[node][next_index[node]]
+                next_index[node] += 1
+                if fathers[neigh] is None:
+                    fathers[neigh] = node
+                    stack.append(neigh)
+            else:
+                stack.pop()
+    return fathers
+
+## ITER
+def _union_find_forest(G: graph.Graph) -> list[int]:
+    # Keep the edges linking two different trees
+    disjoint_set = DisjointSet(G.order)
+    forest = [[] for _ in range(G.order)]
+    for node in range(G.order):
+        for neigh in G.adjlists[node]:
+            if disjoint_set.union(node, neigh):
+                forest[node].append(neigh)
+                forest[neigh].append(node)
+
+    # Orient the forest from the smallest node of each tree
+    fathers = [None] * G.order
+    queue = deque()
+    for root in range(G.order):
+        if fathers[root] is None:
+            fathers[root] = -1
+            queue.append(root)
+            while queue:
+                node = queue.popleft()
+                for neigh in forest[node]:
+                    if fathers[neigh] is None:
+                        fathers[neigh] = node
+                        queue.append(neigh)
+    return fathers
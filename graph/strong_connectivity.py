@@ -1,3 +1,4 @@
+from __future__ import annotations
 from collections import deque
 import graph
 
@@ -50,53 +51,55 @@ def kosaraju(self) -> tuple[list[int], int]:
             __dfs(revG, node, strongly_connected_component_map, number_strongly_connected_components)
     return (strongly_connected_component_map, number_strongly_connected_components)
 
-## REC
+## ITER
 def tarjan(self) -> tuple[list[int], int]:
     """Get the map of strongly connected component for each node and
-    the number of strongly connected components of graph G using Tarjan's algorithm.
+    the number of strongly connected components of graph G using Tarjan's algorithm.\\
+    The depth first search uses an explicit stack, so long paths do not hit the recursion limit.
     """
 
-    def __tarjan_aux(G: graph.Graph, node: int, prefix_index: list[int],
-                     counter: int, strongly_connected_component_map: list[int],
-                     number_strongly_connected_components: int, stack: deque) -> tuple[int, int, int]:
-        stack.append(node)
-        counter += 1
-        prefix_index[node] = counter
-        return_value = counter
-
-        # Recursively add nodes to component and minimize return value
-        for neigh in G.adjlists[node]:
-            if prefix_index[neigh] == 0:
-                return_y, counter, number_strongly_connected_components = __tarjan_aux(G, neigh, prefix_index, counter,
-                                                                                       strongly_connected_component_map,
-                                                                                       number_strongly_connected_components, stack)
-                return_value = min(return_value, return_y)
-            else:
-                return_value = min(return_value, prefix_index[neigh])
-
-        # Return value not minimized means we found the root of a component
-        if return_value == prefix_index[node]:
-            number_strongly_connected_components += 1
-            neigh = -1 # Not a valid node
-            while neigh != node: # Stack empty after last call (root of tree is root of component)
-                neigh = stack.pop()
-                strongly_connected_component_map[neigh] = number_strongly_connected_components
-                prefix_index[neigh] = G.order
-        
-        return (return_value, counter, number_strongly_connected_components)
-
-
-    stack = deque()
     prefix_index = [0] * self.order
+    return_value = [0] * self.order
+    next_index = [0] * self.order
     strongly_connected_component_map = [0] * self.order
     number_strongly_connected_components = 0
     counter = 0
+    # Nodes of the components not yet completed
+    stack = deque()
 
     # Get strongly connected components of all roots
-    for node in range(self.order):
-        if prefix_index[node] == 0:
-            (_, counter, number_strongly_connected_components) = __tarjan_aux(self, node, prefix_index, counter,
-                                                                              strongly_connected_component_map,
-                                                                              number_strongly_connected_components, stack)
+    for root in range(self.order):
+        if prefix_index[root] != 0:
+            continue
 
-    return (strongly_connected_component_map, number_strongly_connected_components)
\ No newline at end of file
+        counter += 1
+        prefix_index[root] = return_value[root] = counter
+        stack.append(root)
+        path = [root]
+        while path:
+            node = path[-1]
+            if next_index[node] < len(self.adjlists[node]):
+                neigh = self.adjlists[node][next_index[node]]
+                next_index[node] += 1
+                if prefix_index[neigh] == 0:
+                    counter += 1
+                    prefix_index[neigh] = return_value[neigh] = counter
+                    stack.append(neigh)
+                    path.append(neigh)
+                else:
+                    return_value[node] = min(return_value[node], prefix_index[neigh])
+            else:
+                path.pop()
+                # Return value not minimized means we found the root of a component
+                if return_value[node] == prefix_index[node]:
+                    number_strongly_connected_components += 1
+                    neigh = -1 # Not a valid node
+                    while neigh != node:
+                        neigh = stack.pop()
+                        strongly_connected_component_map[neigh] = number_strongly_connected_components
+                        prefix_index[neigh] = self.order
+                if path:
+                    father = path[-1]
+                    return_value[father] = min(return_value[father], return_value[node])
+
+    return (strongly_connected_component_map, number_strongly_connected_components)
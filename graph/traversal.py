@@ -1,3 +1,4 @@
+from __future__ import annotations
 from collections import deque
 import graph
 
@@ -62,3 +63,45 @@ def dfs(G: graph.Graph, src: int, dst: int) -> list[int]:
         # Reverse path [dst->src] to [src->dst]
         return res.reverse()
     return res
+
+## ITER
+def shortest_paths(self, src: int) -> tuple[list, list[int]]:
+    """Get the distance from src to each node of graph G (None if unreachable) and the fathers of the
+    shortest path tree (-1 for src and unreachable nodes).\\
+    Use a breadth first search if G has no costs, Dijkstra's algorithm otherwise (non-negative costs).
+    """
+
+    if src >= self.order or src < 0:
+        raise IndexError("Invalid src index")
+
+    dist = [None] * self.order
+    fathers = [-1] * self.order
+    dist[src] = 0
+
+    if self.costs is None:
+        queue = deque([src])
+        while queue:
+            node = queue.popleft()
+            for neigh in self.adjlists[node]:
+                if dist[neigh] is None:
+                    dist[neigh] = dist[node] + 1
+                    fathers[neigh] = node
+                    queue.append(neigh)
+        return (dist, fathers)
+
+    from heapq import heappush, heappop
+
+    heap = [(0, src)]
+    done = [False] * self.order
+    while heap:
+        (d, node) = heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        for neigh in self.adjlists[node]:
+            new_dist = d + self.costs[(node, neigh)]
+            if dist[neigh] is None or new_dist < dist[neigh]:
+                dist[neigh] = new_dist
+                fathers[neigh] = node
+                heappush(heap, (new_dist, neigh))
+    return (dist, fathers)
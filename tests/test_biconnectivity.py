@@ -0,0 +1,97 @@
+import random
+import sys
+import unittest
+
+import graph
+
+
+def number_components(order, edges, removed_node=None):
+    """Count the connected components, without removed_node, by union-find."""
+
+    fathers = list(range(order))
+
+    def find(node):
+        while fathers[node] != node:
+            node = fathers[node]
+        return node
+
+    for (src, dst) in edges:
+        if removed_node not in (src, dst):
+            fathers[find(src)] = find(dst)
+    return len({find(node) for node in range(order) if node != removed_node})
+
+
+def random_graph(rng):
+    order = rng.randint(1, 10)
+    G = graph.Graph(order)
+    edges = []
+    for _ in range(rng.randint(0, 15)):
+        (src, dst) = (rng.randrange(order), rng.randrange(order))
+        G.add_edge(src, dst)
+        edges.append((src, dst))
+    return (G, edges)
+
+
+class TestBiconnectivity(unittest.TestCase):
+
+    def test_against_brute_force(self):
+        rng = random.Random(28)
+        for _ in range(1000):
+            (G, edges) = random_graph(rng)
+            base = number_components(G.order, edges)
+
+            # Removing a cut vertex disconnects its component (an isolated node leaves one less)
+            expected = []
+            for node in range(G.order):
+                isolated = all(neigh == node for neigh in G.adjlists[node])
+                if number_components(G.order, edges, node) > base - isolated:
+                    expected.append(node)
+            self.assertEqual(sorted(G.articulation_points()), expected, edges)
+
+            expected = {tuple(sorted(edge)) for (i, edge) in enumerate(edges)
+                        if number_components(G.order, edges[:i] + edges[i + 1:]) > base}
+            self.assertEqual({tuple(sorted(edge)) for edge in G.bridges()}, expected, edges)
+
+            # Blocks share at most one node, an articulation point
+            components = [set(component) for component in G.biconnected_components()]
+            points = set(G.articulation_points())
+            for i in range(len(components)):
+                for j in range(i):
+                    shared = components[i] & components[j]
+                    self.assertLessEqual(len(shared), 1)
+                    self.assertLessEqual(shared, points)
+
+    def test_block_cut_tree(self):
+        # Two triangles sharing node 2, and a pendant edge (4, 5)
+        G = graph.Graph(6)
+        for (src, dst) in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2), (4, 5)]:
+            G.add_edge(src, dst)
+        self.assertEqual(sorted(G.articulation_points()), [2, 4])
+        self.assertEqual(G.bridges(), [(4, 5)])
+        (tree, nodes) = G.block_cut_tree()
+        self.assertEqual(tree.order, 5)
+        self.assertEqual(sorted(sorted(block) for block in nodes[:3]), [[0, 1, 2], [2, 3, 4], [4, 5]])
+        self.assertEqual(nodes[3:], [[2], [4]])
+        self.assertEqual(sum(len(neighbours) for neighbours in tree.adjlists), 2 * 4)
+
+    def test_deep_chain(self):
+        order = sys.getrecursionlimit() * 3
+        G = graph.Graph(order)
+        for node in range(order - 1):
+            G.add_edge(node, node + 1)
+        self.assertEqual(G.articulation_points(), list(range(1, order - 1)))
+        self.assertEqual(len(G.bridges()), order - 1)
+
+    def test_parallel_edges_are_not_bridges(self):
+        G = graph.Graph(2)
+        G.add_edge(0, 1)
+        G.add_edge(0, 1)
+        self.assertEqual(G.bridges(), [])
+
+    def test_directed(self):
+        with self.assertRaises(Exception):
+            graph.Graph(2, True).articulation_points()
+
+
+if __name__ == "__main__":
+    unittest.main()
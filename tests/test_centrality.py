@@ -0,0 +1,88 @@
+import itertools
+import random
+import unittest
+from collections import deque
+
+import graph
+
+
+def brute_betweenness(G):
+    """Sum over ordered pairs (s, t) of the fraction of shortest s-t paths through each node,
+    enumerating the shortest paths explicitly."""
+
+    def all_shortest_paths(src, dst):
+        # Breadth first search keeping every shortest path
+        paths = {src: [[src]]}
+        dist = {src: 0}
+        queue = deque([src])
+        while queue:
+            node = queue.popleft()
+            for neigh in G.adjlists[node]:
+                if neigh not in dist:
+                    dist[neigh] = dist[node] + 1
+                    paths[neigh] = []
+                    queue.append(neigh)
+                if dist[neigh] == dist[node] + 1:
+                    paths[neigh] += [path + [neigh] for path in paths[node]]
+        return paths.get(dst, [])
+
+    betweenness = [0.0] * G.order
+    for (src, dst) in itertools.permutations(range(G.order), 2):
+        paths = all_shortest_paths(src, dst)
+        for path in paths:
+            for node in path[1:-1]:
+                betweenness[node] += 1 / len(paths)
+    if not G.directed:
+        betweenness = [value / 2 for value in betweenness]
+    return betweenness
+
+
+class TestCentrality(unittest.TestCase):
+
+    def test_betweenness_against_brute_force(self):
+        rng = random.Random(30)
+        for i in range(200):
+            order = rng.randint(1, 8)
+            G = graph.Graph(order, directed=i % 2 == 0)
+            for _ in range(rng.randint(0, 14)):
+                src = rng.randrange(order)
+                neigh = rng.randrange(order)
+                if neigh not in G.adjlists[src]:
+                    G.add_edge(src, neigh)
+            for (computed, expected) in zip(G.betweenness_centrality(), brute_betweenness(G)):
+                self.assertAlmostEqual(computed, expected)
+
+    def test_betweenness_path(self):
+        G = graph.Graph(5)
+        for node in range(4):
+            G.add_edge(node, node + 1)
+        self.assertEqual(G.betweenness_centrality(), [0.0, 3.0, 4.0, 3.0, 0.0])
+        self.assertEqual(G.betweenness_centrality(processes=2), [0.0, 3.0, 4.0, 3.0, 0.0])
+        # All sources sampled: exact result
+        self.assertEqual(G.betweenness_centrality(samples=5, seed=1), [0.0, 3.0, 4.0, 3.0, 0.0])
+
+    def test_invalid_samples(self):
+        G = graph.Graph(3)
+        for samples in (0, -1):
+            with self.assertRaises(ValueError):
+                G.betweenness_centrality(samples=samples)
+
+    def test_pagerank(self):
+        G = graph.Graph(4, True)
+        for (src, dst) in [(0, 1), (1, 2), (2, 0), (0, 3)]:
+            G.add_edge(src, dst)
+        rank = G.pagerank(tolerance=1e-12)
+        self.assertAlmostEqual(sum(rank), 1.0)
+        self.assertAlmostEqual(rank[1], rank[3])
+        self.assertGreater(rank[0], rank[1])
+
+    def test_closeness_and_degree(self):
+        G = graph.Graph(3)
+        G.add_edge(0, 1)
+        G.add_edge(1, 2)
+        self.assertEqual(G.closeness_centrality(), [2 / 3, 1.0, 2 / 3])
+        self.assertEqual(G.degree_centrality(), [0.5, 1.0, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
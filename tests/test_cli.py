@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Longer than the default recursion limit (1000)
+CHAIN_LENGTH = 20000
+
+
+def run_cli(*args):
+    """Run python -m graph with args from the repository root, return the completed process."""
+
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, "-m", "graph", *args, "--no-memory"], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+
+
+class TestCli(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        G = graph.Graph(CHAIN_LENGTH, True)
+        G.add_edges(range(CHAIN_LENGTH - 1), range(1, CHAIN_LENGTH))
+        cls.chain = os.path.join(cls.directory.name, "chain.gra")
+        graph.save(G, cls.chain)
+        G.add_edge(CHAIN_LENGTH - 1, 0)
+        cls.cycle = os.path.join(cls.directory.name, "cycle.gra")
+        graph.save(G, cls.cycle)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def results(self, process):
+        return [json.loads(line)["result"] for line in process.stdout.splitlines()]
+
+    def test_scc_deep_graph(self):
+        process = run_cli(self.chain, "scc")
+        self.assertEqual(process.returncode, 0, process.stderr)
+        (result,) = self.results(process)
+        self.assertEqual(result["count"], CHAIN_LENGTH)
+        self.assertEqual(len(set(result["map"])), CHAIN_LENGTH)
+
+        process = run_cli(self.cycle, "scc")
+        self.assertEqual(process.returncode, 0, process.stderr)
+        (result,) = self.results(process)
+        self.assertEqual(result["count"], 1)
+
+    def test_paths(self):
+        process = run_cli(self.chain, "paths 0", "paths 5")
+        self.assertEqual(process.returncode, 0, process.stderr)
+        (from_first, from_fifth) = self.results(process)
+        self.assertEqual(from_first["dist"], list(range(CHAIN_LENGTH)))
+        self.assertEqual(from_fifth["dist"][:6], [None] * 5 + [0])
+
+    def test_paths_invalid_src(self):
+        for src in ("-1", str(CHAIN_LENGTH)):
+            process = run_cli(self.chain, "paths " + src)
+            self.assertEqual(process.returncode, 1)
+            self.assertEqual(process.stdout, "")
+            self.assertIn("IndexError: Invalid src index", process.stderr)
+
+    def test_invalid_queries(self):
+        process = run_cli(self.chain, "", "paths", "stats 1", "nope", "stats")
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(len(self.results(process)), 1)
+        self.assertIn("empty query", process.stderr)
+        self.assertIn("usage: paths SRC", process.stderr)
+        self.assertIn("unknown query: nope", process.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
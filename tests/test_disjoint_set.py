@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from graph.connectivity import DisjointSet, connected_componnent_map_from_edges_better
+
+
+def reference_components(number_nodes, node_pairs):
+    """Component of each node numbered from 1 by smallest node, by repeated label propagation."""
+
+    labels = list(range(number_nodes))
+    changed = True
+    while changed:
+        changed = False
+        for (node1, node2) in node_pairs:
+            label = min(labels[node1], labels[node2])
+            if labels[node1] != label or labels[node2] != label:
+                (labels[node1], labels[node2]) = (label, label)
+                changed = True
+    numbers = {}
+    for label in labels:
+        numbers.setdefault(label, len(numbers) + 1)
+    return [numbers[label] for label in labels]
+
+
+class TestDisjointSet(unittest.TestCase):
+
+    def test_against_reference(self):
+        rng = random.Random(31)
+        for _ in range(300):
+            number_nodes = rng.randint(1, 40)
+            node_pairs = [(rng.randrange(number_nodes), rng.randrange(number_nodes))
+                          for _ in range(rng.randint(0, 40))]
+            expected = reference_components(number_nodes, node_pairs)
+
+            disjoint_set = DisjointSet(number_nodes)
+            merges = disjoint_set.union_many([pair[0] for pair in node_pairs], [pair[1] for pair in node_pairs])
+            self.assertEqual(merges, number_nodes - max(expected))
+            self.assertEqual(disjoint_set.number_sets, max(expected))
+
+            sizes = disjoint_set.sizes()
+            self.assertEqual(sum(sizes.values()), number_nodes)
+            for node in range(number_nodes):
+                self.assertEqual(disjoint_set.size(node), expected.count(expected[node]))
+                self.assertIn(disjoint_set.find(node), sizes)
+
+            self.assertEqual(disjoint_set.component_map(), (expected, max(expected)))
+            self.assertEqual(connected_componnent_map_from_edges_better(number_nodes, node_pairs),
+                             (expected, max(expected)))
+
+            # Every node is linked to its root after component_map
+            for node in range(number_nodes):
+                father = disjoint_set.fathers[node]
+                self.assertTrue(father < 0 or disjoint_set.fathers[father] < 0)
+
+    def test_union_and_find_many(self):
+        disjoint_set = DisjointSet(5)
+        self.assertTrue(disjoint_set.union(0, 1))
+        self.assertFalse(disjoint_set.union(1, 0))
+        self.assertTrue(disjoint_set.union(3, 1))
+        roots = disjoint_set.find_many([0, 1, 2, 3, 4])
+        self.assertEqual(roots[0], roots[1])
+        self.assertEqual(roots[0], roots[3])
+        self.assertEqual(len(set(roots)), 3)
+        self.assertEqual(disjoint_set.size(3), 3)
+        self.assertEqual(disjoint_set.number_sets, 3)
+
+    def test_long_chain(self):
+        number_nodes = 10000
+        disjoint_set = DisjointSet(number_nodes)
+        disjoint_set.union_many(range(number_nodes - 1), range(1, number_nodes))
+        self.assertEqual(disjoint_set.size(number_nodes - 1), number_nodes)
+        self.assertEqual(disjoint_set.component_map()[1], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
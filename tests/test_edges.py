@@ -0,0 +1,51 @@
+import unittest
+
+import graph
+
+
+class TestRemoveEdges(unittest.TestCase):
+
+    def build(self):
+        # Weighted undirected multigraph: (1, 2) twice, and a self-loop
+        G = graph.Graph(4, costs=True)
+        for (src, dst, cost) in [(0, 1, 1), (1, 2, 2), (2, 0, 3), (1, 2, 5), (3, 3, 4), (2, 3, 6)]:
+            G.add_edge(src, dst, cost)
+        return G
+
+    def edges(self, G):
+        return sorted(sorted(x for x in G.adjlists[node]) for node in range(G.order))
+
+    def test_remove_restore_replay(self):
+        G = self.build()
+        original = self.edges(G)
+
+        delta = G.remove_edges([(2, 1), (0, 1), (3, 3), (0, 3)], log=True)
+        self.assertEqual(sorted(delta), [(0, 1, 1), (1, 2, 5), (3, 3, 4)])
+        self.assertEqual(G.adjlists[1], [2])
+        self.assertEqual(G.adjlists[3], [2])
+        self.assertNotIn((0, 1), G.costs)
+        self.assertNotIn((1, 0), G.costs)
+        removed = self.edges(G)
+
+        G.restore_edges(delta)
+        self.assertEqual(self.edges(G), original)
+        self.assertEqual(G.costs[(1, 0)], 1)
+        self.assertEqual(G.costs[(3, 3)], 4)
+
+        # Replay the log on the restored graph
+        self.assertEqual(sorted(G.remove_edges(delta, log=True)), sorted(delta))
+        self.assertEqual(self.edges(G), removed)
+
+    def test_without_log(self):
+        G = self.build()
+        self.assertIsNone(G.remove_edges([(1, 2)]))
+        self.assertEqual(G.adjlists[1].count(2), 1)
+
+    def test_invalid_index(self):
+        G = self.build()
+        with self.assertRaises(IndexError):
+            G.remove_edges([(0, 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import itertools
+import random
+import unittest
+
+import graph
+
+
+def brute_min_cut(G, src, dst):
+    """Minimum cut capacity over all node sets containing src and not dst."""
+
+    others = [node for node in range(G.order) if node not in (src, dst)]
+    best = None
+    for size in range(len(others) + 1):
+        for chosen in itertools.combinations(others, size):
+            side = set(chosen) | {src}
+            capacity = 0
+            for x in side:
+                for y in G.adjlists[x]:
+                    if y not in side:
+                        capacity += G.costs[(x, y)] if G.costs is not None else 1
+            if best is None or capacity < best:
+                best = capacity
+    return best
+
+
+def random_graph(rng, directed, weighted):
+    """Random graph with parallel and antiparallel edges (a parallel edge shares its cost)."""
+
+    order = rng.randint(2, 8)
+    G = graph.Graph(order, directed, costs=weighted)
+    for _ in range(rng.randint(0, 20)):
+        (src, dst) = (rng.randrange(order), rng.randrange(order))
+        cost = G.costs.get((src, dst), rng.randint(1, 9)) if weighted else None
+        G.add_edge(src, dst, cost)
+    return G
+
+
+class TestFlow(unittest.TestCase):
+
+    def check(self, G, src, dst, result):
+        (value, flow, cut) = result
+        capacity = lambda edge: G.costs[edge] if G.costs is not None else 1
+
+        # The cut is saturated and its capacity is the flow value
+        self.assertEqual(sum(capacity(edge) for edge in cut), value)
+
+        # Capacity constraints
+        multiplicity = {}
+        for x in range(G.order):
+            for y in G.adjlists[x]:
+                if x != y and (G.directed or x < y):
+                    multiplicity[(x, y)] = multiplicity.get((x, y), 0) + 1
+        for ((x, y), number) in multiplicity.items():
+            self.assertLessEqual(flow[(x, y)], number * capacity((x, y)))
+            if G.directed:
+                self.assertGreaterEqual(flow[(x, y)], 0)
+            else:
+                self.assertEqual(flow[(y, x)], -flow[(x, y)])
+
+        # Conservation
+        balance = [0] * G.order
+        for ((x, y), value_xy) in flow.items():
+            if G.directed or x < y:
+                balance[x] -= value_xy
+                balance[y] += value_xy
+        for node in range(G.order):
+            if node not in (src, dst):
+                self.assertEqual(balance[node], 0)
+        self.assertEqual(balance[dst], value if src != dst else 0)
+
+    def test_against_brute_force(self):
+        rng = random.Random(29)
+        for i in range(2000):
+            G = random_graph(rng, directed=i % 2 == 0, weighted=i % 4 < 2)
+            (src, dst) = rng.sample(range(G.order), 2)
+            expected = brute_min_cut(G, src, dst)
+            for algorithm in (G.dinic, G.push_relabel):
+                result = algorithm(src, dst)
+                self.assertEqual(result[0], expected, (algorithm.__name__, G.directed, G.adjlists, G.costs))
+                self.check(G, src, dst, result)
+
+    def test_same_source_and_sink(self):
+        G = graph.Graph(3, True, costs=True)
+        G.add_edge(0, 1, 4)
+        G.add_edge(1, 2, 3)
+        for algorithm in (G.dinic, G.push_relabel):
+            (value, flow, cut) = algorithm(1, 1)
+            self.assertEqual(value, 0)
+            self.assertEqual(flow, {(0, 1): 0, (1, 2): 0})
+            self.assertEqual(cut, [])
+
+    def test_antiparallel_edges(self):
+        G = graph.Graph(3, True, costs=True)
+        for (src, dst, cost) in [(0, 1, 5), (1, 0, 2), (1, 2, 3), (2, 1, 7)]:
+            G.add_edge(src, dst, cost)
+        for algorithm in (G.dinic, G.push_relabel):
+            (value, flow, cut) = algorithm(0, 2)
+            self.assertEqual(value, 3)
+            self.assertEqual(flow[(1, 0)], 0)
+            self.assertEqual(cut, [(1, 2)])
+
+    def test_larger_graph(self):
+        rng = random.Random(1)
+        G = graph.Graph(2000, True, costs=True)
+        for node in range(G.order):
+            for _ in range(5):
+                neigh = rng.randrange(G.order)
+                if neigh != node and (node, neigh) not in G.costs:
+                    G.add_edge(node, neigh, rng.randint(1, 100))
+        self.assertEqual(G.dinic(2, 3)[0], G.push_relabel(2, 3)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import graph
+from graph import generators
+
+
+def edge_set(G):
+    """Set of the (x, y, cost) edges of graph G, cost being None if G has no costs."""
+
+    return {(x, y, G.costs[(x, y)] if G.costs is not None else None)
+            for x in range(G.order) for y in G.adjlists[x]}
+
+
+def flatten(chunks):
+    """List of the edge tuples of chunks."""
+
+    return [edge for chunk in chunks for edge in zip(*chunk)]
+
+
+class TestGenerators(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_seed_reproducibility(self):
+        cases = [
+            lambda seed: generators.erdos_renyi(50, 200, seed),
+            lambda seed: generators.erdos_renyi(50, 200, seed, directed=True, multigraph=True),
+            lambda seed: generators.random_dag(50, 200, seed),
+            lambda seed: generators.barabasi_albert(50, 3, seed),
+            lambda seed: generators.rmat(6, 200, seed=seed),
+            lambda seed: generators.weighted(generators.grid(5, 5), 1, 10, seed),
+        ]
+        for generate in cases:
+            self.assertEqual(flatten(generate(7)), flatten(generate(7)))
+            self.assertNotEqual(flatten(generate(7)), flatten(generate(8)))
+
+    def test_erdos_renyi_distinct_edges(self):
+        edges = flatten(generators.erdos_renyi(20, 150, 1))
+        self.assertEqual(len(edges), 150)
+        self.assertEqual(len(set(edges)), 150)
+        self.assertTrue(all(x < y for (x, y) in edges))
+        with self.assertRaises(ValueError):
+            flatten(generators.erdos_renyi(5, 11, 1))
+
+    def test_random_dag_is_acyclic(self):
+        G = generators.from_chunks(30, generators.random_dag(30, 100, 3), directed=True)
+        order = G.topological_order()
+        rank = {node: i for (i, node) in enumerate(order)}
+        self.assertTrue(all(rank[x] < rank[y] for x in range(G.order) for y in G.adjlists[x]))
+
+    def test_weighted_integer(self):
+        # Float bounds are accepted for integer costs (randint deprecates them in 3.10, rejects them in 3.12)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            edges = flatten(generators.weighted(generators.grid(10, 10), 1.0, 5.0, seed=2, integer=True))
+        self.assertTrue(all(type(cost) is int and 1 <= cost <= 5 for (_, _, cost) in edges))
+        edges = flatten(generators.weighted(generators.grid(10, 10), 1.0, 5.0, seed=2))
+        self.assertTrue(all(1.0 <= cost < 5.0 for (_, _, cost) in edges))
+
+    def test_csr_from_chunks(self):
+        G = generators.from_chunks(30, generators.erdos_renyi(30, 80, 4))
+        (offsets, targets) = generators.csr_from_chunks(30, generators.erdos_renyi(30, 80, 4))
+        for node in range(G.order):
+            self.assertEqual(sorted(targets[offsets[node]:offsets[node + 1]]), sorted(G.adjlists[node]))
+
+    def test_save_chunks_round_trip(self):
+        for (directed, integer) in ((False, False), (True, False), (False, True)):
+            chunks = list(generators.weighted(generators.erdos_renyi(40, 120, 5, directed), 0, 100, 6, integer))
+            graph.save_chunks(self.path("g.wgra"), 40, chunks, directed)
+            G = graph.load_weightedgraph(self.path("g.wgra"), int if integer else float)
+            self.assertEqual(G.directed, directed)
+            self.assertEqual(edge_set(G), edge_set(generators.from_chunks(40, chunks, directed)))
+
+    def test_save_binary_round_trip(self):
+        for directed in (False, True):
+            for weighted in (False, True):
+                chunks = generators.erdos_renyi(40, 120, 5, directed)
+                if weighted:
+                    chunks = generators.weighted(chunks, 0, 100, 6)
+                G = generators.from_chunks(40, chunks, directed)
+                graph.save_binary(G, self.path("g.grb"))
+                H = graph.load_binary(self.path("g.grb"))
+                self.assertEqual((H.order, H.directed), (G.order, G.directed))
+                self.assertEqual(edge_set(H), edge_set(G))
+
+    def test_save_binary_chunks_round_trip(self):
+        chunks = list(generators.weighted(generators.grid(300, 300), seed=9))
+        self.assertGreater(len(chunks), 1)
+        graph.save_binary_chunks(self.path("g.grb"), 300 * 300, chunks, weighted=True)
+        H = graph.load_binary(self.path("g.grb"))
+        self.assertEqual(edge_set(H), edge_set(generators.from_chunks(300 * 300, chunks)))
+
+    def test_save_binary_rejects_none_costs(self):
+        G = graph.Graph(3, costs=True)
+        G.add_edge(0, 1, 2.5)
+        G.add_edge(1, 2)
+        with self.assertRaises(ValueError):
+            graph.save_binary(G, self.path("g.grb"))
+        self.assertFalse(os.path.exists(self.path("g.grb")))
+        with self.assertRaises(ValueError):
+            graph.save_binary_chunks(self.path("h.grb"), 3, [([0, 1], [1, 2], [2.5, None])], weighted=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
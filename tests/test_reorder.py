@@ -0,0 +1,100 @@
+import random
+import unittest
+
+import graph
+from graph import generators
+
+METHODS = ("bfs", "rcm", "degree")
+
+
+def random_graph(order, size, directed, seed):
+    """Random weighted multigraph with self-loops and labels."""
+
+    rng = random.Random(seed)
+    G = graph.Graph(order, directed, True, ["n" + str(node) for node in range(order)])
+    for _ in range(size):
+        (x, y) = (rng.randrange(order), rng.randrange(order))
+        G.add_edge(x, y, rng.randint(1, 9))
+        if rng.random() < 0.2:
+            # Parallel edge, its cost replaces the previous one
+            G.add_edge(x, y, rng.randint(1, 9))
+    return G
+
+
+def bandwidth(G):
+    """Largest |x - y| over the edges (x, y) of graph G."""
+
+    return max((abs(x - y) for x in range(G.order) for y in G.adjlists[x]), default=0)
+
+
+class TestReorder(unittest.TestCase):
+
+    def check(self, G, method):
+        (H, permutation, inverse) = G.reorder(method)
+        self.assertEqual(sorted(permutation), list(range(G.order)))
+        self.assertEqual([permutation[old] for old in inverse], list(range(G.order)))
+        self.assertEqual((H.order, H.directed), (G.order, G.directed))
+
+        for old in range(G.order):
+            new = permutation[old]
+            # Parallel edges are merged, adjacency lists are sorted
+            self.assertEqual(H.adjlists[new], sorted({permutation[neigh] for neigh in G.adjlists[old]}))
+            self.assertEqual(H.labels[new], G.labels[old])
+            for neigh in G.adjlists[old]:
+                self.assertEqual(H.costs[(new, permutation[neigh])], G.costs[(old, neigh)])
+        self.assertEqual(len(H.costs), len(G.costs))
+        return H
+
+    def test_random_graphs(self):
+        for seed in range(30):
+            for directed in (False, True):
+                G = random_graph(random.Random(seed).randint(1, 25), 40, directed, seed)
+                for method in METHODS:
+                    self.check(G, method)
+
+    def test_input_unchanged(self):
+        G = random_graph(15, 30, False, 1)
+        adjlists = [list(neighbours) for neighbours in G.adjlists]
+        costs = dict(G.costs)
+        for method in METHODS:
+            G.reorder(method)
+        self.assertEqual(G.adjlists, adjlists)
+        self.assertEqual(G.costs, costs)
+
+    def test_without_costs_and_labels(self):
+        G = generators.from_chunks(50, generators.erdos_renyi(50, 100, 2))
+        for method in METHODS:
+            (H, permutation, _) = G.reorder(method)
+            self.assertIsNone(H.costs)
+            self.assertFalse(H.labels)
+            self.assertEqual(sum(map(len, H.adjlists)), sum(map(len, G.adjlists)))
+
+    def test_orders(self):
+        # Star with centre 3 and a separate edge
+        G = graph.Graph(7)
+        G.add_edges([3, 3, 3, 5], [0, 1, 2, 6])
+        (_, _, inverse) = G.reorder("bfs")
+        self.assertEqual(inverse, [0, 3, 1, 2, 4, 5, 6])
+        (_, _, inverse) = G.reorder("degree")
+        self.assertEqual(inverse[0], 3)
+        self.assertEqual(inverse[-1], 4)
+
+    def test_rcm_bandwidth(self):
+        # Shuffled grid: reverse Cuthill-McKee recovers a bandwidth close to the number of columns
+        G = generators.from_chunks(20 * 20, generators.grid(20, 20))
+        shuffle = list(range(G.order))
+        random.Random(3).shuffle(shuffle)
+        shuffled = graph.Graph(G.order)
+        shuffled.adjlists = [sorted(shuffle[neigh] for neigh in G.adjlists[old])
+                             for old in sorted(range(G.order), key=shuffle.__getitem__)]
+        (H, _, _) = shuffled.reorder("rcm")
+        self.assertLessEqual(bandwidth(H), 2 * 20)
+        self.assertGreater(bandwidth(shuffled), 4 * 20)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            graph.Graph(3).reorder("random")
+
+
+if __name__ == "__main__":
+    unittest.main()
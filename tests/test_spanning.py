@@ -0,0 +1,61 @@
+import sys
+import unittest
+
+import graph
+
+
+def chain(order, directed=False):
+    G = graph.Graph(order, directed, costs=True)
+    for node in range(order - 1):
+        G.add_edge(node, node + 1, node)
+    return G
+
+
+class TestSpanningForest(unittest.TestCase):
+
+    def test_deep_chain(self):
+        # Deeper than the recursion limit
+        order = sys.getrecursionlimit() * 3
+        G = chain(order)
+        expected = [-1] + list(range(order - 1))
+        for method in ("bfs", "dfs", "union_find"):
+            self.assertEqual(G.spanning_forest(method), expected, method)
+
+    def test_forest_of_cycles(self):
+        G = graph.Graph(7)
+        for (src, dst) in [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)]:
+            G.add_edge(src, dst)
+        for method in ("bfs", "dfs", "union_find"):
+            fathers = G.spanning_forest(method)
+            self.assertEqual(fathers.count(-1), 3, method)
+            for (node, father) in enumerate(fathers):
+                if father != -1:
+                    self.assertIn(father, G.adjlists[node])
+
+    def test_graph_keeps_costs_and_input(self):
+        G = chain(1000)
+        G.add_edge(0, 999, -1)
+        adjlists = [list(neighbours) for neighbours in G.adjlists]
+        F = G.spanning_forest_graph("dfs")
+        self.assertEqual(G.adjlists, adjlists)
+        self.assertEqual(sum(len(neighbours) for neighbours in F.adjlists), 2 * 999)
+        for ((src, dst), cost) in F.costs.items():
+            self.assertEqual(G.costs[(src, dst)], cost)
+
+    def test_labels_are_copied(self):
+        G = graph.Graph(2, labels=['a', 'b'])
+        G.add_edge(0, 1)
+        F = G.spanning_forest_graph()
+        F.add_node(1, ['c'])
+        self.assertEqual(G.labels, ['a', 'b'])
+        self.assertEqual(F.labels, ['a', 'b', 'c'])
+
+    def test_union_find_directed(self):
+        with self.assertRaises(ValueError):
+            chain(3, True).spanning_forest("union_find")
+        with self.assertRaises(ValueError):
+            chain(3).spanning_forest("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()